@@ -16,11 +16,7 @@ export LD_LIBRARY_PATH=/opt/rocm/lib:${LD_LIBRARY_PATH}
 # 4. Disable MLIR backend (causes crashes on RDNA 3)
 export MIGRAPHX_DISABLE_MLIR=1
 
-# 5. Set MIGraphX model cache path to avoid recompilation across restarts
-# This caches compiled MIGraphX models, reducing startup time on subsequent runs
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-export ORT_MIGRAPHX_MODEL_CACHE_PATH="${SCRIPT_DIR}/.migraphx_cache"
-mkdir -p "${ORT_MIGRAPHX_MODEL_CACHE_PATH}"
+# Compiled MIGraphX programs are cached by the service under ${MODEL_CACHE_DIR}/migraphx
 
 # Activate virtual environment and run the service
 source .venv/bin/activate
@@ -20,12 +20,14 @@ class Settings(BaseSettings):
 
     # ONNX Runtime settings
     onnx_providers: str = "CPUExecutionProvider"
+    ort_intra_op_threads: int = 0  # Threads per ONNX Runtime session (0 = half the CPU cores)
 
     # InsightFace settings
     insightface_model: str = "buffalo_l"
     det_size: int = 1280
     det_size_fallback: int = 640  # Smaller detection size for small images
     det_size_threshold: int = 900  # Use fallback detector if image max dim < this
+    decode_downscale: bool = True  # Decode JPEGs >2x/4x/8x det_size at 1/2, 1/4 or 1/8 resolution
 
     # Logging
     log_level: str = "INFO"
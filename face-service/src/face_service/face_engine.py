@@ -1,17 +1,306 @@
 """Face detection and embedding extraction engine using InsightFace."""
 
+import base64
+import glob
 import logging
+import mmap
+import os
+import queue
+import tempfile
+import threading
 import time
-from typing import ClassVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Literal
 
+import cv2
 import numpy as np
+import onnx
 import onnxruntime as ort
-from insightface.app import FaceAnalysis
+from insightface.app.common import Face
+from insightface.model_zoo import ArcFaceONNX, RetinaFace
+from insightface.utils import ensure_available, face_align
 
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# "list": JSON array of floats; "b64f32": base64 of the raw little-endian float32 vector
+EmbeddingFormat = Literal["list", "b64f32"]
+
+
+def _model_task(graph: onnx.GraphProto) -> str | None:
+    """Classify an InsightFace model from its ONNX graph signature.
+
+    Mirrors the detection/recognition rules of InsightFace's ``ModelRouter``,
+    but inspects the graph instead of building a session, so models the
+    service does not use (landmarks, gender/age) never get one.
+    """
+    if len(graph.output) >= 5:
+        return "detection"
+
+    dims = [
+        d.dim_value if d.HasField("dim_value") else d.dim_param
+        for d in graph.input[0].type.tensor_type.shape.dim
+    ]
+    if (
+        len(dims) == 4
+        and isinstance(dims[2], int)
+        and dims[2] == dims[3]
+        and dims[2] >= 112
+        and dims[2] % 16 == 0
+        and dims[2] != 192  # 2d106det/1k3d68 landmark models
+    ):
+        return "recognition"
+    return None
+
+
+def _detector_dim_overrides(graph: onnx.GraphProto, det_size: int) -> dict[str, int]:
+    """Map the detector's symbolic NCHW input dims onto (1, 3, det_size, det_size).
+
+    SCRFD exports leave batch/height/width symbolic (older buffalo packs use a
+    single ``?`` for both spatial axes), which makes JIT providers recompile
+    whenever they see a new shape. Pinning them lets each session compile once.
+    """
+    overrides = {}
+    for dim, value in zip(graph.input[0].type.tensor_type.shape.dim, (1, 3, det_size, det_size)):
+        if not dim.HasField("dim_value") and dim.dim_param:
+            overrides[dim.dim_param] = value
+    return overrides
+
+
+class _DetectorBuffers:
+    """Reusable letterbox canvas, NCHW input blob and session outputs for one input size."""
+
+    def __init__(self, input_size: tuple[int, int]) -> None:
+        width, height = input_size
+        self.canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        self.blob = np.empty((1, 3, height, width), dtype=np.float32)
+        # Bound after the first run, once the output shapes are known
+        self.binding: ort.IOBinding | None = None
+        self.outputs: list[np.ndarray] = []
+
+
+class _Detector(RetinaFace):
+    """InsightFace's SCRFD detector, letterboxing into pooled buffers.
+
+    Upstream ``detect`` allocates a resized copy, a zeroed canvas and a float32
+    blob on every call (~25MB at 1280x1280). The session input size is fixed,
+    so those buffers are borrowed from a pool and reused afterwards. Callers
+    beyond ``MAX_POOLED_BUFFERS`` get fresh buffers that are dropped on release,
+    so a burst of requests doesn't keep its peak memory pinned.
+    """
+
+    MAX_POOLED_BUFFERS = 4
+
+    def __init__(self, model_file: str, session: ort.InferenceSession) -> None:
+        super().__init__(model_file=model_file, session=session)
+        self._buffers: queue.Queue[_DetectorBuffers] = queue.Queue(maxsize=self.MAX_POOLED_BUFFERS)
+
+    def _acquire_buffers(self) -> _DetectorBuffers:
+        try:
+            return self._buffers.get_nowait()
+        except queue.Empty:
+            return _DetectorBuffers(self.input_size)
+
+    def _release_buffers(self, buffers: _DetectorBuffers) -> None:
+        try:
+            self._buffers.put_nowait(buffers)
+        except queue.Full:
+            pass
+
+    def _letterbox(self, img: np.ndarray, canvas: np.ndarray) -> float:
+        """Resize ``img`` into the top-left of ``canvas``, zero the rest, return the scale."""
+        height, width = canvas.shape[:2]
+        im_ratio = float(img.shape[0]) / img.shape[1]
+        if im_ratio > float(height) / width:
+            new_height = height
+            new_width = int(new_height / im_ratio)
+        else:
+            new_width = width
+            new_height = int(new_width * im_ratio)
+
+        region = canvas[:new_height, :new_width]
+        resized = cv2.resize(img, (new_width, new_height), dst=region)
+        if resized is not region:
+            region[...] = resized
+        canvas[new_height:] = 0
+        canvas[:new_height, new_width:] = 0
+        return float(new_height) / img.shape[0]
+
+    def _fill_blob(self, canvas: np.ndarray, blob: np.ndarray) -> None:
+        """Equivalent of ``cv2.dnn.blobFromImage(..., swapRB=True)`` written into ``blob``."""
+        np.copyto(blob[0], canvas[..., ::-1].transpose(2, 0, 1), casting="unsafe")
+        blob -= self.input_mean
+        blob *= 1.0 / self.input_std
+
+    def _run(self, buffers: _DetectorBuffers) -> list[np.ndarray]:
+        """Run the session on ``buffers.blob``, returning outputs owned by ``buffers``.
+
+        The first run of a buffer set goes through ``session.run`` to learn the
+        output shapes. Afterwards the blob and those output arrays are bound by
+        pointer, so runs neither copy the feed nor allocate result arrays.
+        """
+        if buffers.binding is not None:
+            self.session.run_with_iobinding(buffers.binding)
+            return buffers.outputs
+
+        blob = buffers.blob
+        net_outs = self.session.run(self.output_names, {self.input_name: blob})
+        binding = self.session.io_binding()
+        binding.bind_input(
+            self.input_name, "cpu", 0, blob.dtype, list(blob.shape), blob.ctypes.data
+        )
+        for name, out in zip(self.output_names, net_outs):
+            out = np.ascontiguousarray(out)
+            binding.bind_output(name, "cpu", 0, out.dtype, list(out.shape), out.ctypes.data)
+            buffers.outputs.append(out)
+        buffers.binding = binding
+        return buffers.outputs
+
+    def _anchors(self, input_height: int, input_width: int) -> tuple[np.ndarray, np.ndarray]:
+        """Anchor centers ``(A, 2)`` and strides ``(A, 1)`` of all FPN levels, in output order.
+
+        Built once per input size; sessions have a fixed size, so after the
+        warmup run every detection reuses the cached arrays.
+        """
+        key = (input_height, input_width)
+        anchors = self.center_cache.get(key)
+        if anchors is not None:
+            return anchors
+
+        centers = []
+        strides = []
+        for stride in self._feat_stride_fpn:
+            height = input_height // stride
+            width = input_width // stride
+            level = np.stack(np.mgrid[:height, :width][::-1], axis=-1).astype(np.float32)
+            level = np.repeat((level * stride).reshape((-1, 2)), self._num_anchors, axis=0)
+            centers.append(level)
+            strides.append(np.full((len(level), 1), stride, dtype=np.float32))
+
+        anchors = np.concatenate(centers), np.concatenate(strides)
+        self.center_cache[key] = anchors
+        return anchors
+
+    def forward(self, buffers: _DetectorBuffers, threshold: float):
+        """Decode the boxes (and landmarks) of every anchor scoring at least ``threshold``.
+
+        All FPN levels are handled at once: the per-level outputs are concatenated
+        in the same order as ``_anchors`` and filtered with a single mask.
+        Everything returned is a new array rather than a view of the bound
+        outputs, so the buffers can go back to the pool once this returns.
+        """
+        net_outs = self._run(buffers)
+        # Batched exports carry a leading batch axis
+        net_outs = [o[0] if o.ndim == 3 else o for o in net_outs]
+        fmc = self.fmc
+        centers, strides = self._anchors(*buffers.blob.shape[2:4])
+
+        scores = np.concatenate(net_outs[:fmc]).ravel()
+        mask = scores >= threshold
+        centers = centers[mask]
+        strides = strides[mask]
+
+        bbox_preds = np.concatenate(net_outs[fmc : 2 * fmc])[mask] * strides
+        bboxes = np.hstack((centers - bbox_preds[:, :2], centers + bbox_preds[:, 2:]))
+
+        kpss = None
+        if self.use_kps:
+            kps_preds = np.concatenate(net_outs[2 * fmc :])[mask] * strides
+            # Explicit point count: a -1 axis can't be inferred when no anchor passed
+            kpss = kps_preds.reshape((-1, kps_preds.shape[1] // 2, 2)) + centers[:, None, :]
+        return scores[mask], bboxes, kpss
+
+    def detect(self, img: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        buffers = self._acquire_buffers()
+        try:
+            det_scale = self._letterbox(img, buffers.canvas)
+            self._fill_blob(buffers.canvas, buffers.blob)
+            scores, bboxes, kpss = self.forward(buffers, self.det_thresh)
+        finally:
+            self._release_buffers(buffers)
+
+        bboxes /= det_scale
+        # NMSBoxes takes (x, y, w, h) and returns the kept indices by descending
+        # score. The +1 matches the inclusive-pixel areas of InsightFace's own NMS.
+        keep = cv2.dnn.NMSBoxes(
+            np.hstack((bboxes[:, :2], bboxes[:, 2:] - bboxes[:, :2] + 1)),
+            scores,
+            self.det_thresh,
+            self.nms_thresh,
+        )
+        keep = np.asarray(keep, dtype=np.intp).reshape(-1)
+        det = np.hstack((bboxes[keep], scores[keep, None])).astype(np.float32, copy=False)
+
+        if kpss is not None:
+            kpss = kpss[keep] / det_scale
+        return det, kpss
+
+
+class _Recognizer(ArcFaceONNX):
+    """ArcFace model that embeds all faces of an image in batched runs.
+
+    Upstream runs the session once per face. Here the aligned crops are batched
+    and each batch is padded up to one of ``BATCH_SIZES``, so providers that
+    compile per input shape (MIGraphX) only ever see those shapes.
+    """
+
+    BATCH_SIZES = (1, 2, 4, 8)
+
+    def embed(self, img: np.ndarray, kpss: np.ndarray) -> np.ndarray:
+        """Return one embedding row per landmark set in ``kpss``."""
+        image_size = self.input_size[0]
+        crops = [face_align.norm_crop(img, landmark=kps, image_size=image_size) for kps in kpss]
+        max_batch = self.BATCH_SIZES[-1]
+
+        embeddings = []
+        for start in range(0, len(crops), max_batch):
+            chunk = crops[start : start + max_batch]
+            count = len(chunk)
+            batch_size = next(size for size in self.BATCH_SIZES if size >= count)
+            chunk += [np.zeros_like(chunk[0])] * (batch_size - count)
+            embeddings.append(self.get_feat(chunk)[:count])
+        return np.concatenate(embeddings)
+
+
+class _FaceAnalysis:
+    """Drop-in for InsightFace's ``FaceAnalysis`` built from engine-owned sessions.
+
+    ``FaceAnalysis`` constructs its ONNX sessions internally with default
+    ``SessionOptions``; this keeps the same ``prepare``/``get`` surface while
+    letting ``FaceEngine`` decide how each session is built.
+    """
+
+    def __init__(self, models: dict) -> None:
+        self.models = models
+        self.det_model = models["detection"]
+
+    def prepare(self, ctx_id: int, det_thresh: float = 0.5, det_size=(640, 640)) -> None:
+        for taskname, model in self.models.items():
+            if taskname == "detection":
+                # A session with frozen input dims already reports its input size
+                input_size = None if model.input_size is not None else det_size
+                model.prepare(ctx_id, input_size=input_size, det_thresh=det_thresh)
+            else:
+                model.prepare(ctx_id)
+
+    def get(self, img: np.ndarray, embed: bool = True) -> list[Face]:
+        bboxes, kpss = self.det_model.detect(img)
+        faces = [
+            Face(
+                bbox=bboxes[i, 0:4],
+                kps=kpss[i] if kpss is not None else None,
+                det_score=bboxes[i, 4],
+            )
+            for i in range(bboxes.shape[0])
+        ]
+
+        rec_model = self.models.get("recognition")
+        if embed and faces and rec_model is not None:
+            for face, embedding in zip(faces, rec_model.embed(img, kpss)):
+                face.embedding = embedding
+        return faces
+
 
 class FaceEngine:
     """Singleton face detection engine using InsightFace.
@@ -19,6 +308,7 @@ class FaceEngine:
     Uses a hybrid dual-detector approach:
     - High-res detector (1280x1280) on GPU (MIGraphX) for large images
     - Low-res detector (640x640) on CPU for small images
+    - A single recognition model on GPU (FP16) shared by both detectors
 
     This avoids MIGraphX multi-session GPU crashes while maintaining
     high performance and accuracy.
@@ -26,19 +316,27 @@ class FaceEngine:
 
     _instance: ClassVar["FaceEngine | None"] = None
     _initialized: ClassVar[bool] = False
+    # Serializes construction so concurrent first callers (lifespan startup and an
+    # early request) don't each load and compile the models
+    _init_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __new__(cls) -> "FaceEngine":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        with cls._init_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
     def __init__(self) -> None:
         if FaceEngine._initialized:
             return
 
-        settings = get_settings()
-        self._setup_providers(settings)
-        FaceEngine._initialized = True
+        with FaceEngine._init_lock:
+            if FaceEngine._initialized:
+                return
+
+            settings = get_settings()
+            self._setup_providers(settings)
+            FaceEngine._initialized = True
 
     def _build_gpu_providers(self, settings) -> list:
         """Build ONNX providers list for GPU (MIGraphX)."""
@@ -59,6 +357,8 @@ class FaceEngine:
                             "migraphx_fp16_enable": "1",
                             "migraphx_int8_enable": "0",
                             "migraphx_exhaustive_tune": "1",
+                            # Persist compiled programs so restarts skip JIT compilation
+                            "migraphx_model_cache_dir": self._migraphx_cache_dir(settings),
                         },
                     )
                 )
@@ -75,10 +375,252 @@ class FaceEngine:
 
         return providers
 
+    def _migraphx_cache_dir(self, settings) -> str:
+        """Directory for MIGraphX compiled programs, created on first use."""
+        cache_dir = os.path.join(settings.model_cache_dir, "migraphx")
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
     def _build_cpu_providers(self) -> list:
         """Build ONNX providers list for CPU only."""
         return ["CPUExecutionProvider"]
 
+    def _optimized_model_path(
+        self, settings, onnx_file: str, cpu_only: bool, dim_overrides: dict[str, int]
+    ) -> str:
+        """Location of the serialized, graph-optimized copy of an ONNX model."""
+        stem = os.path.splitext(os.path.basename(onnx_file))[0]
+        if dim_overrides:
+            # Overridden dims are baked into the serialized graph
+            stem += "." + "x".join(str(v) for v in dim_overrides.values())
+        # Neither level bakes in hardware-specific layouts, so the copies stay
+        # valid when the cache volume moves to a different host
+        level = "extended" if cpu_only else "basic"
+        return os.path.join(
+            settings.model_cache_dir,
+            "optimized",
+            settings.insightface_model,
+            f"{stem}.ort{ort.__version__}.{level}.onnx",
+        )
+
+    def _session_options(
+        self, level: ort.GraphOptimizationLevel, dim_overrides: dict[str, int]
+    ) -> ort.SessionOptions:
+        """Build SessionOptions shared by every session the engine creates."""
+        settings = get_settings()
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = level
+
+        # Input shapes are fixed per session, so allocation patterns can be planned
+        # once and served from the arena instead of allocating on every run
+        sess_options.enable_mem_pattern = True
+        sess_options.enable_cpu_mem_arena = True
+
+        # Both detectors and concurrent requests share the CPU: cap intra-op
+        # threads and stop idle workers from spin-waiting between runs
+        sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        sess_options.intra_op_num_threads = settings.ort_intra_op_threads or max(
+            1, (os.cpu_count() or 2) // 2
+        )
+        sess_options.inter_op_num_threads = 1
+        sess_options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+
+        for name, value in dim_overrides.items():
+            sess_options.add_free_dimension_override_by_name(name, value)
+        return sess_options
+
+    def _create_session(
+        self,
+        settings,
+        onnx_file: str,
+        providers: list,
+        dim_overrides: dict[str, int] | None = None,
+    ) -> ort.InferenceSession:
+        """Create an InferenceSession, reusing the optimized model from a previous start.
+
+        The serialized copy is produced by a throwaway CPU session and only holds
+        portable optimizations: ORT_ENABLE_EXTENDED for CPU sessions, and
+        ORT_ENABLE_BASIC for GPU sessions since compiling providers (MIGraphX)
+        cannot serialize their graphs. Layout transforms (NCHWc) and provider
+        work are applied when the copy is loaded.
+        """
+        provider_names = [p if isinstance(p, str) else p[0] for p in providers]
+        cpu_only = provider_names == ["CPUExecutionProvider"]
+        dim_overrides = dim_overrides or {}
+        optimized_path = self._optimized_model_path(settings, onnx_file, cpu_only, dim_overrides)
+
+        if not os.path.exists(optimized_path):
+            self._write_optimized_model(
+                onnx_file,
+                optimized_path,
+                ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+                if cpu_only
+                else ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+                dim_overrides,
+            )
+
+        # Load the serialized graph; only passes that were not baked in still run
+        sess_options = self._session_options(
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL, dim_overrides
+        )
+        try:
+            return ort.InferenceSession(
+                optimized_path, sess_options=sess_options, providers=providers
+            )
+        except Exception as e:
+            cache_error = e
+
+        # Provider failures (compile errors, OOM) hit the original model too and
+        # propagate from here, leaving the valid cached copy in place
+        session = ort.InferenceSession(onnx_file, sess_options=sess_options, providers=providers)
+        logger.warning(f"Discarding unusable optimized model {optimized_path}: {cache_error}")
+        try:
+            os.remove(optimized_path)
+        except FileNotFoundError:
+            pass
+        return session
+
+    def _write_optimized_model(
+        self,
+        onnx_file: str,
+        optimized_path: str,
+        level: ort.GraphOptimizationLevel,
+        dim_overrides: dict[str, int],
+    ) -> None:
+        """Serialize ``onnx_file`` optimized at ``level`` to ``optimized_path``.
+
+        Each writer uses its own temporary file and renames it into place, so
+        concurrent writers (both init threads, or replicas sharing the cache
+        volume) never truncate or move each other's output.
+        """
+        directory = os.path.dirname(optimized_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f"{os.path.basename(optimized_path)}.", suffix=".tmp", dir=directory
+        )
+        os.close(fd)
+        try:
+            sess_options = self._session_options(level, dim_overrides)
+            sess_options.optimized_model_filepath = tmp_path
+            ort.InferenceSession(
+                onnx_file, sess_options=sess_options, providers=["CPUExecutionProvider"]
+            )
+            os.replace(tmp_path, optimized_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _load_analysis(
+        self,
+        settings,
+        model_dir: str,
+        providers: list,
+        det_size: int,
+        allowed_modules: list[str],
+    ) -> _FaceAnalysis:
+        """Load the InsightFace model pack with sessions built by ``_create_session``.
+
+        The detector session is specialized to ``det_size`` x ``det_size``.
+        """
+        models = {}
+        for onnx_file in sorted(glob.glob(os.path.join(model_dir, "*.onnx"))):
+            graph = onnx.load(onnx_file, load_external_data=False).graph
+            task = _model_task(graph)
+            if task not in allowed_modules or task in models:
+                continue
+
+            if task == "detection":
+                dim_overrides = _detector_dim_overrides(graph, det_size)
+                session = self._create_session(settings, onnx_file, providers, dim_overrides)
+                models[task] = _Detector(model_file=onnx_file, session=session)
+            else:
+                session = self._create_session(settings, onnx_file, providers)
+                models[task] = _Recognizer(model_file=onnx_file, session=session)
+        return _FaceAnalysis(models)
+
+    def _preload_models(self, settings, model_dir: str) -> None:
+        """Map the model files read at startup so they are served from the page cache.
+
+        Covers the model pack and any serialized optimized models for this ONNX
+        Runtime version. The maps are kept on ``self._mmaps`` to keep the pages
+        referenced for as long as the engine lives.
+        """
+        paths = glob.glob(os.path.join(model_dir, "*.onnx")) + glob.glob(
+            os.path.join(
+                settings.model_cache_dir,
+                "optimized",
+                settings.insightface_model,
+                f"*.ort{ort.__version__}.*.onnx",
+            )
+        )
+
+        self._mmaps = []
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # unreadable or empty file
+                continue
+
+            if hasattr(mmap, "MADV_WILLNEED"):
+                # Kernel readahead of the whole file, without copying it to user space
+                mapped.madvise(mmap.MADV_WILLNEED)
+            else:
+                for offset in range(0, len(mapped), mmap.PAGESIZE):
+                    mapped[offset]
+            self._mmaps.append(mapped)
+
+        total_mb = sum(len(m) for m in self._mmaps) / (1024 * 1024)
+        logger.info(f"Preloaded {len(self._mmaps)} model files ({total_mb:.0f} MB)")
+
+    def _init_high_res(self, settings, model_dir: str, gpu_providers: list) -> _FaceAnalysis:
+        """Initialize the high-res detector on GPU."""
+        logger.info(f"1. High-Res (GPU): {settings.det_size}x{settings.det_size} [MIGraphX] -- Model: {settings.insightface_model}")
+        start_time = time.time()
+        app = self._load_analysis(
+            settings,
+            model_dir,
+            gpu_providers,
+            settings.det_size,
+            allowed_modules=["detection", "recognition"],
+        )
+        app.prepare(ctx_id=0, det_size=(settings.det_size, settings.det_size))
+
+        # Verify active providers for High-Res
+        try:
+            # Inspect the detection model session
+            det_providers = app.det_model.session.get_providers()
+            logger.info(f"   -> Active providers (High-Res): {det_providers}")
+
+            # Check if MIGraphX is actually active
+            if "MIGraphXExecutionProvider" not in det_providers:
+                logger.warning("   -> WARNING: MIGraphX requested but NOT active! Running on CPU?")
+        except Exception as e:
+            logger.warning(f"   -> Could not verify active providers: {e}")
+
+        logger.info(f"   -> High-Res ready in {time.time() - start_time:.1f}s")
+        return app
+
+    def _init_low_res(self, settings, model_dir: str, cpu_providers: list) -> _FaceAnalysis:
+        """Initialize the low-res detector on CPU.
+
+        Recognition is attached afterwards from the high-res (GPU) models.
+        """
+        logger.info(
+            f"2. Low-Res (CPU): {settings.det_size_fallback}x{settings.det_size_fallback} [CPU]"
+        )
+        start_time = time.time()
+        app = self._load_analysis(
+            settings,
+            model_dir,
+            cpu_providers,
+            settings.det_size_fallback,
+            allowed_modules=["detection"],
+        )
+        app.prepare(ctx_id=0, det_size=(settings.det_size_fallback, settings.det_size_fallback))
+        logger.info(f"   -> Low-Res ready in {time.time() - start_time:.1f}s")
+        return app
+
     def _setup_providers(self, settings) -> None:
         """Configure and initialize hybrid face analysis models."""
         gpu_providers = self._build_gpu_providers(settings)
@@ -90,54 +632,28 @@ class FaceEngine:
         self.det_size_threshold = settings.det_size_threshold
         self.use_dual_detectors = settings.det_size > settings.det_size_fallback
 
+        # Download (first run) before any loader thread starts reading the pack
+        model_dir = ensure_available(
+            "models", settings.insightface_model, root=settings.model_cache_dir
+        )
+        self._preload_models(settings, model_dir)
+
         if self.use_dual_detectors:
             logger.info("Initializing Hybrid Dual-Detector Setup:")
 
-            # 1. High-Res Detector on GPU
-            logger.info(f"1. High-Res (GPU): {settings.det_size}x{settings.det_size} [MIGraphX] -- Model: {settings.insightface_model}")
-            start_time = time.time()
-            self.app_high = FaceAnalysis(
-                name=settings.insightface_model,
-                providers=gpu_providers,
-                allowed_modules=["detection", "recognition"],
-                root=settings.model_cache_dir,
-            )
-            self.app_high.prepare(ctx_id=0, det_size=(settings.det_size, settings.det_size))
+            # GPU compile and CPU session setup do not contend, so overlap them
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="face-init") as executor:
+                high = executor.submit(self._init_high_res, settings, model_dir, gpu_providers)
+                low = executor.submit(self._init_low_res, settings, model_dir, cpu_providers)
+                self.app_high = high.result()
+                self.app_low = low.result()
 
-            # Verify active providers for High-Res
-            try:
-                # Inspect the detection model session
-                det_providers = self.app_high.det_model.session.get_providers()
-                logger.info(f"   -> Active providers (High-Res): {det_providers}")
-
-                # Check if MIGraphX is actually active
-                if "MIGraphXExecutionProvider" not in det_providers:
-                    logger.warning(
-                        "   -> WARNING: MIGraphX requested but NOT active! Running on CPU?"
-                    )
-            except Exception as e:
-                logger.warning(f"   -> Could not verify active providers: {e}")
-
-            logger.info(f"   -> Ready in {time.time() - start_time:.1f}s")
-
-            # 2. Low-Res Detector on CPU
-            logger.info(
-                f"2. Low-Res (CPU): {settings.det_size_fallback}x{settings.det_size_fallback} [CPU]"
-            )
-            start_time = time.time()
-            self.app_low = FaceAnalysis(
-                name=settings.insightface_model,
-                providers=cpu_providers,
-                allowed_modules=["detection", "recognition"],
-                root=settings.model_cache_dir,
-            )
-            self.app_low.prepare(
-                ctx_id=0, det_size=(settings.det_size_fallback, settings.det_size_fallback)
-            )
-            logger.info(f"   -> Ready in {time.time() - start_time:.1f}s")
+            # Embed small-image faces on the GPU (FP16) session too, rather than
+            # running ArcFace-R50 on CPU through a second copy of the model
+            self.app_low.models["recognition"] = self.app_high.models["recognition"]
 
             # Pre-warm
-            self._prewarm_detectors()
+            self._prewarm_detectors(settings)
 
             self.app = self.app_high  # Default
 
@@ -146,57 +662,97 @@ class FaceEngine:
             logger.info(
                 f"Initializing Single Detector (GPU): {settings.det_size}x{settings.det_size}"
             )
-            self.app = FaceAnalysis(
-                name=settings.insightface_model,
-                providers=gpu_providers,
+            self.app = self._load_analysis(
+                settings,
+                model_dir,
+                gpu_providers,
+                settings.det_size,
                 allowed_modules=["detection", "recognition"],
-                root=settings.model_cache_dir,
             )
             self.app.prepare(ctx_id=0, det_size=(settings.det_size, settings.det_size))
             self.app_high = self.app
             self.app_low = self.app
 
-            self._prewarm_single()
+            self._prewarm_single(settings)
 
-    def _prewarm_detectors(self) -> None:
-        """Pre-warm both detectors."""
-        logger.info("Pre-warming detectors...")
+    def _prewarm(
+        self, app: _FaceAnalysis, label: str, size: int, warm_recognition: bool = True
+    ) -> None:
+        """Run inferences at production shapes to trigger compilation.
 
-        # High-res (GPU) - Triggers compilation
-        logger.info("Pre-warming High-Res (GPU)...")
+        The warmup image matches the detector input so its letterbox/resize path
+        is exercised too, and runs twice because throughput keeps ramping after
+        the first call. A blank image yields no faces, so the recognition model
+        is driven directly at each of its batch sizes unless ``warm_recognition``
+        is False (it is shared with an app that warms it already).
+        """
+        logger.info(f"Pre-warming {label} at {size}x{size}...")
         t0 = time.time()
+        image = np.zeros((size, size, 3), dtype=np.uint8)
+        rec_model = app.models.get("recognition") if warm_recognition else None
+        # Separate guards so a detector failure can't skip the recognizer's
+        # compilation, which would otherwise land on the first real request
         try:
-            self.app_high.get(np.zeros((64, 64, 3), dtype=np.uint8))
+            for _ in range(2):
+                app.get(image, embed=False)
         except Exception as e:
-            logger.warning(f"High-res pre-warm warning: {e}")
-        logger.info(f"-> Done in {time.time() - t0:.1f}s")
+            logger.warning(f"{label} detector pre-warm warning: {e}")
 
-        # Low-res (CPU)
-        logger.info("Pre-warming Low-Res (CPU)...")
-        t0 = time.time()
-        try:
-            self.app_low.get(np.zeros((64, 64, 3), dtype=np.uint8))
-        except Exception as e:
-            logger.warning(f"Low-res pre-warm warning: {e}")
-        logger.info(f"-> Done in {time.time() - t0:.1f}s")
+        if rec_model is not None:
+            width, height = rec_model.input_size
+            crop = np.zeros((height, width, 3), dtype=np.uint8)
+            try:
+                for _ in range(2):
+                    for batch_size in rec_model.BATCH_SIZES:
+                        rec_model.get_feat([crop] * batch_size)
+            except Exception as e:
+                logger.warning(f"{label} recognition pre-warm warning: {e}")
+        logger.info(f"-> {label} done in {time.time() - t0:.1f}s")
 
-    def _prewarm_single(self) -> None:
-        logger.info("Pre-warming single detector...")
-        try:
-            self.app.get(np.zeros((64, 64, 3), dtype=np.uint8))
-        except Exception:
-            pass
-        logger.info("Pre-warm complete.")
+    def _prewarm_detectors(self, settings) -> None:
+        """Pre-warm both detectors concurrently."""
+        logger.info("Pre-warming detectors...")
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="face-warmup") as executor:
+            # High-res (GPU) triggers compilation; low-res (CPU) runs alongside it.
+            # The recognizer is shared, so only the high-res warmup drives it.
+            warmups = [
+                executor.submit(self._prewarm, self.app_high, "High-Res (GPU)", settings.det_size),
+                executor.submit(
+                    self._prewarm,
+                    self.app_low,
+                    "Low-Res (CPU)",
+                    settings.det_size_fallback,
+                    warm_recognition=False,
+                ),
+            ]
+            for warmup in warmups:
+                warmup.result()
+
+    def _prewarm_single(self, settings) -> None:
+        self._prewarm(self.app, "Single Detector (GPU)", settings.det_size)
 
     @classmethod
     def get_instance(cls) -> "FaceEngine":
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
-
-    def detect(self, image: np.ndarray) -> list[dict]:
+        if cls._initialized:
+            return cls._instance
+        return cls()
+
+    def detect(
+        self,
+        image: np.ndarray,
+        embedding_format: EmbeddingFormat = "list",
+        bbox_scale: float = 1.0,
+        include_embedding: bool = True,
+    ) -> list[dict]:
         """
         Detect faces using the appropriate detector based on image size.
+
+        With ``embedding_format="b64f32"`` each embedding is returned as a base64
+        string of its raw float32 bytes, skipping the float-to-decimal expansion.
+        ``bbox_scale`` maps boxes back to the source resolution when ``image``
+        was decoded downscaled. ``include_embedding=False`` skips the recognition
+        model entirely and returns an empty embedding for every face.
         """
         height, width = image.shape[:2]
         max_dim = max(height, width)
@@ -209,19 +765,48 @@ class FaceEngine:
             detector = self.app_high
             det_type = "High-Res (GPU)"
 
-        logger.debug(f"Detecting faces in {width}x{height} image using {det_type}")
+        # Checked once so production (INFO) requests skip the formatting and timing
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Detecting faces in %dx%d image using %s", width, height, det_type)
+            start_time = time.perf_counter()
 
-        start_time = time.time()
-        faces = detector.get(image)
-        elapsed = time.time() - start_time
+        faces = detector.get(image, embed=include_embedding)
+
+        if debug:
+            elapsed = time.perf_counter() - start_time
+            logger.debug(
+                "Detection finished in %.1fms. Found %d faces.", elapsed * 1000, len(faces)
+            )
+
+        if not faces:
+            return []
 
-        logger.debug(f"Detection finished in {elapsed * 1000:.1f}ms. Found {len(faces)} faces.")
+        # Stack once and convert each array with a single tolist() instead of
+        # boxing every bbox/embedding element per face
+        bboxes = np.stack([face.bbox for face in faces]).astype(np.float32, copy=False)
+        if bbox_scale != 1.0:
+            bboxes *= bbox_scale
+        scores = np.fromiter((face.det_score for face in faces), dtype=np.float32, count=len(faces))
+
+        if not include_embedding:
+            embeddings_out = [[] for _ in faces]
+        else:
+            embeddings = np.ascontiguousarray(
+                np.stack([face.embedding for face in faces]), dtype="<f4"
+            )
+            if embedding_format == "b64f32":
+                embeddings_out = [
+                    base64.b64encode(row.tobytes()).decode("ascii") for row in embeddings
+                ]
+            else:
+                embeddings_out = embeddings.tolist()
 
         return [
             {
-                "bbox": [float(x) for x in face.bbox],
-                "embedding": face.embedding.tolist(),
-                "det_score": float(face.det_score),
+                "bbox": bbox,
+                "embedding": embedding,
+                "det_score": det_score,
                 "age": int(face.age) if hasattr(face, "age") and face.age is not None else None,
                 "gender": (
                     "M"
@@ -231,7 +816,9 @@ class FaceEngine:
                     else None
                 ),
             }
-            for face in faces
+            for face, bbox, embedding, det_score in zip(
+                faces, bboxes.tolist(), embeddings_out, scores.tolist()
+            )
         ]
 
     def get_embedding_dimension(self) -> int:
@@ -0,0 +1,152 @@
+"""Image decoding for uploaded and base64-encoded images."""
+
+import logging
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+except ImportError:  # optional dependency: pip install face-service[turbojpeg]
+    TurboJPEG = None
+
+logger = logging.getLogger(__name__)
+
+# Start-of-frame markers of baseline/progressive/lossless JPEGs (excludes DHT/JPG/DAC)
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# libjpeg scales these down in the DCT domain, skipping most of the IDCT work
+_REDUCED_FLAGS = {
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+}
+
+
+def jpeg_size(data: bytes) -> tuple[int, int] | None:
+    """Read ``(width, height)`` from a JPEG's SOF segment without decoding it."""
+    if data[:2] != b"\xff\xd8":
+        return None
+
+    i = 2
+    while i + 4 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # standalone markers
+            i += 2
+            continue
+        if marker in _SOF_MARKERS:
+            if i + 9 > len(data):
+                return None
+            height = int.from_bytes(data[i + 5 : i + 7], "big")
+            width = int.from_bytes(data[i + 7 : i + 9], "big")
+            return width, height
+        i += 2 + int.from_bytes(data[i + 2 : i + 4], "big")
+    return None
+
+
+def _exif_orientation(data: bytes) -> int:
+    """Read a JPEG's EXIF orientation tag (1, upright, when absent)."""
+    i = 2
+    while i + 4 <= len(data) and data[i] == 0xFF:
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in (0xD9, 0xDA):  # no metadata after start of scan
+            break
+        length = int.from_bytes(data[i + 2 : i + 4], "big")
+        if marker == 0xE1 and data[i + 4 : i + 10] == b"Exif\0\0":
+            tiff = data[i + 10 : i + 2 + length]
+            order = "little" if tiff[:2] == b"II" else "big"
+            ifd = int.from_bytes(tiff[4:8], order)
+            count = int.from_bytes(tiff[ifd : ifd + 2], order)
+            for entry in range(ifd + 2, ifd + 2 + 12 * count, 12):
+                if int.from_bytes(tiff[entry : entry + 2], order) == 0x0112:
+                    return int.from_bytes(tiff[entry + 8 : entry + 10], order)
+            return 1
+        i += 2 + length
+    return 1
+
+
+@lru_cache
+def _turbojpeg() -> "TurboJPEG | None":
+    """Shared TurboJPEG decoder, or None when PyTurboJPEG/libturbojpeg is unavailable."""
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except Exception as e:
+        logger.warning(f"libturbojpeg unavailable, decoding JPEGs with OpenCV: {e}")
+        return None
+
+
+def _decode_turbojpeg(data: bytes, scale: int) -> np.ndarray | None:
+    """Decode (and downscale by ``scale``) a JPEG straight to BGR with libjpeg-turbo.
+
+    Returns None when the OpenCV path should be used instead: TurboJPEG is not
+    available, the image is not upright (TurboJPEG ignores EXIF orientation,
+    which OpenCV applies) or the data fails to decode.
+    """
+    decoder = _turbojpeg()
+    if decoder is None or _exif_orientation(data) != 1:
+        return None
+    try:
+        return decoder.decode(
+            data,
+            pixel_format=TJPF_BGR,
+            scaling_factor=(1, scale) if scale > 1 else None,
+        )
+    except Exception:
+        return None
+
+
+def decode_image(
+    data: bytes, det_size: int | None = None
+) -> tuple[np.ndarray | None, int, int, int]:
+    """Decode image bytes into a BGR array.
+
+    When ``det_size`` is given, JPEGs more than 2x/4x/8x larger than it are
+    downscaled by the same factor during decode. The detector shrinks them to
+    ``det_size`` anyway, and the decoded image never drops below it. JPEGs go
+    through libjpeg-turbo directly when PyTurboJPEG is installed.
+
+    Returns ``(image, width, height, scale)``: ``width``/``height`` are the
+    source dimensions and ``scale`` maps decoded pixel coordinates back to the
+    source image. ``image`` is None when the data cannot be decoded.
+    """
+    size = jpeg_size(data)
+    scale = 1
+    if size is not None and det_size:
+        scale = next((f for f in _REDUCED_FLAGS if max(size) > f * det_size), 1)
+
+    if size is not None:
+        image = _decode_turbojpeg(data, scale)
+        if image is not None:
+            width, height = size
+            return image, width, height, scale
+
+    nparr = np.frombuffer(data, np.uint8)
+
+    if scale == 1:
+        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        if image is None:
+            return None, 0, 0, 1
+        height, width = image.shape[:2]
+        return image, width, height, 1
+
+    image = cv2.imdecode(nparr, _REDUCED_FLAGS[scale])
+    if image is None:
+        return None, 0, 0, 1
+
+    # imdecode applies EXIF orientation, so the SOF size may be transposed
+    width, height = size
+    decoded_height, decoded_width = image.shape[:2]
+    if (decoded_width > decoded_height) != (width > height):
+        width, height = height, width
+    return image, width, height, scale
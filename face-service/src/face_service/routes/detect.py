@@ -3,22 +3,29 @@
 import logging
 import time
 
-import cv2
-import numpy as np
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
-from ..face_engine import FaceEngine
+from ..config import get_settings
+from ..face_engine import EmbeddingFormat, FaceEngine
+from ..image_decode import decode_image
 
 router = APIRouter(tags=["detection"])
 logger = logging.getLogger(__name__)
 
 
+def _downscale_target() -> int | None:
+    """Detector size large JPEGs may be reduced towards while decoding, if enabled."""
+    settings = get_settings()
+    return settings.det_size if settings.decode_downscale else None
+
+
 class FaceResult(BaseModel):
     """Individual face detection result."""
 
     bbox: list[float]
-    embedding: list[float]
+    embedding: list[float] | str
     det_score: float
     age: int | None = None
     gender: str | None = None
@@ -34,13 +41,18 @@ class DetectResponse(BaseModel):
 
 
 @router.post("/detect", response_model=DetectResponse)
-async def detect_faces(file: UploadFile = File(...)) -> DetectResponse:
+async def detect_faces(
+    file: UploadFile = File(...),
+    embedding_format: EmbeddingFormat = "list",
+    include_embedding: bool = True,
+) -> DetectResponse:
     """
     Detect faces in an uploaded image and extract embeddings.
 
     Accepts image files (JPEG, PNG, WebP, etc.) and returns:
     - Bounding boxes for each detected face
-    - 512-dimensional embedding vectors
+    - 512-dimensional embedding vectors (float list, or base64 float32 with
+      ``embedding_format=b64f32``; empty with ``include_embedding=false``)
     - Detection confidence scores
     - Estimated age and gender (if available)
     """
@@ -50,8 +62,10 @@ async def detect_faces(file: UploadFile = File(...)) -> DetectResponse:
     if not contents:
         raise HTTPException(status_code=400, detail="Empty file")
 
-    nparr = np.frombuffer(contents, np.uint8)
-    image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    # Decode and inference are blocking C calls; keep them off the event loop
+    image, width, height, scale = await run_in_threadpool(
+        decode_image, contents, _downscale_target()
+    )
 
     if image is None:
         raise HTTPException(
@@ -59,12 +73,17 @@ async def detect_faces(file: UploadFile = File(...)) -> DetectResponse:
             detail="Invalid image format. Supported: JPEG, PNG, WebP, BMP, TIFF",
         )
 
-    height, width = image.shape[:2]
-    logger.debug(f"Processing image: {width}x{height}")
+    logger.debug(f"Processing image: {width}x{height} (decoded at 1/{scale})")
 
     try:
         engine = FaceEngine.get_instance()
-        faces = engine.detect(image)
+        faces = await run_in_threadpool(
+            engine.detect,
+            image,
+            embedding_format,
+            bbox_scale=scale,
+            include_embedding=include_embedding,
+        )
     except Exception as e:
         logger.error(f"Face detection failed: {e}")
         raise HTTPException(status_code=500, detail="Face detection failed") from e
@@ -85,6 +104,8 @@ class ExtractRequest(BaseModel):
     """Request for embedding extraction from base64 image."""
 
     image_base64: str
+    embedding_format: EmbeddingFormat = "list"
+    include_embedding: bool = True
 
 
 @router.post("/extract-embedding", response_model=DetectResponse)
@@ -103,17 +124,22 @@ async def extract_embedding_base64(request: ExtractRequest) -> DetectResponse:
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid base64 encoding")
 
-    nparr = np.frombuffer(image_data, np.uint8)
-    image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    image, width, height, scale = await run_in_threadpool(
+        decode_image, image_data, _downscale_target()
+    )
 
     if image is None:
         raise HTTPException(status_code=400, detail="Invalid image data")
 
-    height, width = image.shape[:2]
-
     try:
         engine = FaceEngine.get_instance()
-        faces = engine.detect(image)
+        faces = await run_in_threadpool(
+            engine.detect,
+            image,
+            request.embedding_format,
+            bbox_scale=scale,
+            include_embedding=request.include_embedding,
+        )
     except Exception as e:
         logger.error(f"Face detection failed: {e}")
         raise HTTPException(status_code=500, detail="Face detection failed") from e
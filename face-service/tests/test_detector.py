@@ -0,0 +1,67 @@
+"""Tests for the SCRFD postprocessing in ``_Detector``."""
+
+import queue
+
+import numpy as np
+
+from face_service.face_engine import _Detector, _FaceAnalysis
+
+INPUT_SIZE = 64
+STRIDES = (8, 16, 32)
+NUM_ANCHORS = 2
+
+
+def _outputs(hits: tuple[int, ...] = ()) -> list[np.ndarray]:
+    """Fake SCRFD outputs (scores, boxes, keypoints per level) with unit distances.
+
+    ``hits`` are indices into the stride-8 level whose score passes the threshold.
+    """
+    counts = [(INPUT_SIZE // stride) ** 2 * NUM_ANCHORS for stride in STRIDES]
+    scores = [np.zeros((count, 1), dtype=np.float32) for count in counts]
+    scores[0][list(hits)] = 0.9
+    boxes = [np.ones((count, 4), dtype=np.float32) for count in counts]
+    kpss = [np.zeros((count, 10), dtype=np.float32) for count in counts]
+    return scores + boxes + kpss
+
+
+def _detector(outputs: list[np.ndarray]) -> _Detector:
+    """A ``_Detector`` for a 64x64 input whose session run returns ``outputs``."""
+    detector = _Detector.__new__(_Detector)
+    detector.input_size = (INPUT_SIZE, INPUT_SIZE)
+    detector.input_mean = 127.5
+    detector.input_std = 128.0
+    detector.det_thresh = 0.5
+    detector.nms_thresh = 0.4
+    detector.fmc = len(STRIDES)
+    detector._feat_stride_fpn = list(STRIDES)
+    detector._num_anchors = NUM_ANCHORS
+    detector.use_kps = True
+    detector.center_cache = {}
+    detector._buffers = queue.Queue(maxsize=_Detector.MAX_POOLED_BUFFERS)
+    detector._run = lambda buffers: outputs
+    return detector
+
+
+def test_detect_without_faces_returns_empty_arrays():
+    detector = _detector(_outputs())
+
+    det, kpss = detector.detect(np.zeros((INPUT_SIZE, INPUT_SIZE, 3), dtype=np.uint8))
+
+    assert det.shape == (0, 5)
+    assert kpss.shape == (0, 5, 2)
+
+
+def test_detect_decodes_boxes_and_keypoints_from_anchor_centers():
+    # Anchors 0/1 sit at (0, 0); anchor 2 is the first one centered at (8, 0)
+    detector = _detector(_outputs(hits=(2,)))
+
+    det, kpss = detector.detect(np.zeros((INPUT_SIZE, INPUT_SIZE, 3), dtype=np.uint8))
+
+    np.testing.assert_allclose(det, [[0.0, -8.0, 16.0, 8.0, 0.9]])
+    np.testing.assert_allclose(kpss, np.tile([8.0, 0.0], (1, 5, 1)))
+
+
+def test_face_analysis_get_without_faces_returns_empty_list():
+    app = _FaceAnalysis({"detection": _detector(_outputs())})
+
+    assert app.get(np.zeros((INPUT_SIZE, INPUT_SIZE, 3), dtype=np.uint8)) == []